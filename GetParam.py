@@ -11,11 +11,10 @@ at sh.yogaswara@gmail.com
 
 [LIBRARIES]
 datetime
+numpy
+pandas
 re
-
-[MOIDULES]
-day_translator (github/shyogaswara)
-
+re2 (google-re2, optional)
 
 [CHANGELOG 1/2024]
 - rewrite all function from previous release into GetParam class
@@ -23,15 +22,84 @@ day_translator (github/shyogaswara)
 '''
 
 import re
+import numpy as np
 import pandas as pd
-from datetime import datetime
+from datetime import date
 
-from day_translator import dayTranslate, monthTranslate
+try:
+    # linear time DFA engine, used only for the simple number pattern of
+    # get_mag and get_depth, its \d is ASCII only which is enough there
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
 
 __author__ = 'Shandy Yogaswara'
 __version_info__ = (2024, 1, 'aN (Alpha Release)')
 __version__ = ".".join(map(str, __version_info__))
 
+# compiled once at import, reused for every short messages
+_NUM_RE = _re_engine.compile(r"[-+]?\d+(?:\.\d+)?")
+# latitude, latlocator, longitude, lonlocator, and location string that
+# located between () brackets, all from one search. latitude can be
+# either before or after longitude. kept on re to match the same way as
+# _MSG_RE
+_LOC_RE = re.compile(r"(?:(\d+\.\d+)\s*(LS|LU)[\s,-]*(\d+\.\d+)\s*(BT|BB)"
+                     r"|(\d+\.\d+)\s*(BT|BB)[\s,-]*(\d+\.\d+)\s*(LS|LU))\s*\(([^)]+)")
+
+# whole message pattern, follow the same segment as param_split so any
+# messages that match it can also be parsed per parameter, case sensitive
+# like _LOC_RE. used by _parse_all and by pandas str.extract in batch
+# mode, each named group become one column of the resulted DataFrame.
+# pandas always use re, so _MSG_RE stay on re too
+_MSG_PATTERN = (r"^[^\d,]*Mag:\s*(?P<mag>\d+\.\d+)[^\d,]*,"
+                r"\s*(?P<date>\d{1,2}-\w{3}-\d{2})\s+(?P<time>\d{2}:\d{2}:\d{2})\s+(?P<zone>WI\w*)\s*,"
+                r"[^\d,]*(?P<lat>\d+\.\d+)\s*(?P<latloc>LS|LU)[\s,-]*(?P<lon>\d+\.\d+)\s*(?P<lonloc>BT|BB)"
+                r"\s*\((?P<locstr>[^)]+)\)\s*,\s*Kedlmn:[\s,]*(?P<depth>\d+)[^\d,]*$")
+_MSG_RE = re.compile(_MSG_PATTERN)
+
+# Indonesian month abbreviation that differ from english one
+_MONTH_MAP = {'mei':'May', 'agu':'Aug', 'okt':'Oct', 'des':'Dec'}
+
+# month number from both english and Indonesian abbreviation
+_MONTH_NUM = {m: i for i, m in enumerate(('jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                                          'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+_MONTH_NUM.update({k: _MONTH_NUM[v.lower()] for k, v in _MONTH_MAP.items()})
+
+# Indonesian day name by date.weekday() and month name by date.month
+_ID_DAYS = ('Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu')
+_ID_MONTHS = (None, 'Januari', 'Februari', 'Maret', 'April', 'Mei', 'Juni', 'Juli',
+              'Agustus', 'September', 'Oktober', 'November', 'Desember')
+
+# sign of latitude and longitude from its locator code, LS (south) and
+# BB (west) are negative
+_LAT_SIGN = {'LS': -1.0, 'LU': 1.0}
+_LON_SIGN = {'BT': 1.0, 'BB': -1.0}
+
+
+def _parse_date(text):
+    '''
+    [Arguments]
+    text : str
+        date in dd-mmm-yy format, month can be either english or
+        Indonesian abbreviation
+
+    [Returns]
+    dates : date
+
+    [Raises]
+    ValueError, KeyError
+        if the string is not in dd-mmm-yy format or not a valid date
+    '''
+    day, month, year = text.split('-')
+
+    # format is fixed so parse it directly instead of strptime, only
+    # 1-2 digit year like %y, and follow the same rule (69-99 is 19xx)
+    if not (year.isdigit() and len(year) <= 2):
+        raise ValueError(f'year {year} is not in yy format')
+    year = int(year)
+    year += 2000 if year < 69 else 1900
+    return date(year, _MONTH_NUM[month.lower()], int(day))
+
 
 class GetParam:
     ''' Class used to get parameters which is origin time, magnitudes
@@ -48,7 +116,8 @@ class GetParam:
         
     [Methods]
     get_param(self)
-        get result from all function
+        get result from all function, from single match of the whole
+        short messages if possible, otherwise per parameter
     param_split(self)
         Split parameters from short messages with coma, depends on 
         circumstances it will be splitted into 4 or 5, if 5, combine the
@@ -61,9 +130,22 @@ class GetParam:
         Get depth
     get_loc(self)
         Get latitude, longitude, and location string
+    parse_batch(cls, series)
+        Get magnitude, origin time, latitude, longitude, location string,
+        and depth from many short messages at once as DataFrame
+    parse_many(cls, texts)
+        Get result from all function of many short messages as dict of
+        arrays, one array for each parameter
     '''
     recognized_str1 = 'Info Gempa. Mag:2.9, 21-mei-24 18:29:27 WIB, Lok:0.30 LS,100.28 BT (9 km Tenggara Bukittinggi), Kedlmn: 10 Km ::BMKG-PGR VI'
     recognized_str2 = 'Info Gempa Mag:3.0, 21-Jan-24 18:29:27 WIB,Lok: 2.52 LS - 102.26 BT (49 km Tenggara MERANGIN-JAMBI), Kedlmn: 5 Km ::BMKG-KSI'
+
+    # fixed attributes without per instance __dict__, smaller instance
+    # and faster attribute access when parsing many short messages
+    __slots__ = ('text_str', 'param_text', 'mag', 'dayname', 'origintime',
+                 'timestring', 'depth', 'locstring', 'location', 'latitude',
+                 'longitude', 'latlocator', 'lonlocator')
+
     def __init__(self, text_str):
         '''
         [Arguments]
@@ -79,47 +161,82 @@ class GetParam:
         '''
         get result from all function
         '''
-        self.get_mag()
-        self.get_ot()
-        self.get_depth()
-        self.get_loc()
+        if not self._parse_all():
+            # parse per parameter to raise error of the exact parameter
+            self.get_mag()
+            self.get_ot()
+            self.get_depth()
+            self.get_loc()
+
+    def _parse_all(self):
+        '''
+        [Variables]
+        msg : dict
+            all parameters from single match of the whole short messages
+
+        [Returns]
+        bool
+            True if all parameters found, False if the short messages
+            need to be parsed per parameter to find which one is wrong
+        '''
+        msg = _MSG_RE.search(self.text_str)
+        if msg is None:
+            return False
+
+        msg = msg.groupdict()
+        lat = float(msg['lat'])
+        if not -11.0 <= _LAT_SIGN[msg['latloc']] * lat <= 6 or not msg['locstr'].strip():
+            return False
+
+        try:
+            dates = _parse_date(msg['date'])
+        except (KeyError, ValueError):
+            return False
+
+        self.mag = float(msg['mag'])
+        self.depth = int(msg['depth'])
+        self._set_ot(dates, f"{msg['time']} {msg['zone']}")
+        self._set_loc(lat, msg['latloc'], float(msg['lon']), msg['lonloc'], msg['locstr'])
+        return True
 
     def param_split(self):
         '''
         [Variables]
-        text_split : str
-            short messages of eartrhquake that splitted by coma
+        s : str
+            short messages of eartrhquake that will be splitted by coma
+        commas : int
+            number of coma in the short messages
+        i1, i2, i_last : int
+            position of 1st, 2nd, and last coma, used to slice the short
+            messages without splitting all of it
         param_text : str
             list of splitted string
-        index : int
-            index number for iterating text_split to param_text
 
         [Raises]
         SyntaxError
             if the short messages either didnt had 3 or 4 commas or 
             unrecognized format
         '''
-        self.param_text = []
+        s = self.text_str
+        commas = s.count(',')
 
-        index = [0,1,-1]
-        text_split = self.text_str.split(',')
-
-        for i in index:
-            self.param_text.append(text_split[i].strip())
-        
-        if len(text_split) == 5:
+        if commas not in (3, 4):
             ''' According to BMKG earthquake information in short
             messages format, the message string can only splited into
             4 or 5 segment by using comma as separator, however there
             may be another case. please check the error message for
             more information.
             '''
-            s = f'{text_split[2]} - {text_split[3]}'
-            self.param_text.append(s.strip())
-        elif len(text_split) == 4:
-            self.param_text.append(text_split[2].strip())
-        else:
             raise SyntaxError(f'Short Messages format unrecognized, please use recognized format such as {GetParam.recognized_str1} or {GetParam.recognized_str2}.')
+
+        i1 = s.find(',')
+        i2 = s.find(',', i1 + 1)
+        i_last = s.rfind(',')
+
+        # if 5 segment, 3rd and 4th segment already combined with
+        # their coma inside the slice between 2nd and last coma
+        self.param_text = [s[:i1].strip(), s[i1+1:i2].strip(), s[i_last+1:].strip(),
+                           s[i2+1:i_last].strip()]
     
     def get_mag(self):
         '''
@@ -132,26 +249,21 @@ class GetParam:
             if the magnitude resulted from string didnt result in float 
             or too many float number found in the string
         '''
-        self.mag = [float(i) for i in (re.findall(r"[-+]?(?:\d*\.*\d+)", self.param_text[0]))]
+        nums = _NUM_RE.findall(self.param_text[0])
         
-        if len(self.mag) < 1:
-            raise ValueError(f'Magnitude number cant be found in {self.param_text[0]}, please check the messages, the magnitude shall be inside Info gempa Mag:X.Y')
-        elif len(self.mag) > 1:
-            raise ValueError(f'too many float number, cant found real magnitude from {self.mag}')
+        if len(nums) != 1:
+            raise ValueError(f'cant found real magnitude from {nums} in {self.param_text[0]}, please check the messages, the magnitude shall be inside Info gempa Mag:X.Y')
+
+        self.mag = float(nums[0])
     
     def get_ot(self):
         '''
         [Variables]
         text_split : str, list
             list of string
-        dates : str, list
-            list of string for date only, to translate few month name 
-            that not already in english
-        dates : datetime
-            combination from prevoius split string in datetime format 
-            %d %b %y
-        dname, mname : datetime
-            name of day and month in datetime format
+        dates : date
+            date from string in dd-mmm-yy format, month can be either
+            english or Indonesian abbreviation
         dayname : str
             translated day name 
         origintime : str
@@ -170,19 +282,7 @@ class GetParam:
 
         try:
             text_split = self.param_text[1].split()
-            dates = text_split[0].split('-')
-
-            if dates[1] in ['Mei','mei']:
-                dates[1] = 'May'
-            elif dates[1] in ['Agu','agu']:
-                dates[1] = 'Aug'
-            elif dates[1] in ['Okt','okt']:
-                dates[1] = 'Oct'
-            elif dates[1] in ['Des','des']:
-                dates[1] = 'Dec'
-
-            dates = datetime.strptime(' '.join(dates), '%d %b %y').date()
-            dname, mname = dates.strftime('%A'), dates.strftime('%b')
+            dates = _parse_date(text_split[0])
         
         except:
             raise TypeError('cannot determine datetime format, should be dd-mmm-yy')
@@ -190,9 +290,19 @@ class GetParam:
         if len(text_split) != 3:
             raise IndexError(f'timestring in {self.param_text[1]} not properly splitted, please refer to [{GetParam.recognized_str1}] or [{GetParam.recognized_str2}] format as example')
 
-        self.dayname = dayTranslate(dname)[1]
-        self.origintime = f'{dates.day} {monthTranslate(mname)[1]} {dates.year}'
-        self.timestring = f'{text_split[1]} {text_split[2]}'
+        self._set_ot(dates, f'{text_split[1]} {text_split[2]}')
+
+    def _set_ot(self, dates, timestring):
+        '''
+        [Arguments]
+        dates : date
+            origin date
+        timestring : str
+            hour minute second and time zone in string format
+        '''
+        self.dayname = _ID_DAYS[dates.weekday()]
+        self.origintime = f'{dates.day} {_ID_MONTHS[dates.month]} {dates.year}'
+        self.timestring = timestring
 
 
     def get_depth(self):
@@ -206,25 +316,27 @@ class GetParam:
             if the depth resulted from string didnt result in int or too
             many int number found in the string
         '''
-        # find numbers in string that match [-+]?(?:\d*\.*\d+)
-        # where \d is digit
-        self.depth = [int(i) for i in (re.findall(r"[-+]?(?:\d*\.*\d+)", self.param_text[2]))]
-        if len(self.depth) < 1:
-            raise ValueError(f'depth number cant be found in {self.param_text[2]}, please check the messages, the depth shall be inside Kedlmn:X Km')
-        elif len(self.depth) > 1:
-            raise ValueError(f'too many int number, cant found real depth from {self.depth}')
+        # find numbers in string that match [-+]?\d+(?:\.\d+)?
+        # where \d is digit, there shall be exactly one number
+        nums = _NUM_RE.findall(self.param_text[2])
+        if len(nums) != 1:
+            raise ValueError(f'cant found real depth from {nums} in {self.param_text[2]}, please check the messages, the depth shall be inside Kedlmn:X Km')
+
+        self.depth = int(nums[0])
 
     def get_loc(self):
         '''
         [Parameters]
-        latlocator : str, list
-            list of locator data for latitude
-        lonlocator : str, list
-            list of locator data for longitude
+        loc : re.Match
+            single match of latitude, latlocator code (LS/LU),
+            longitude, lonlocator code (BT/BB), and location string,
+            latitude can be written before or after longitude
+        latlocator : str
+            latitude number with its locator code
+        lonlocator : str
+            longitude number with its locator code
         locstring : str
             string of earthquake location information
-        latlon : float, list
-            latitude and longitude number
         latitude : float
             latitude value, negative if latlocator = LS
         longitude : float
@@ -232,44 +344,144 @@ class GetParam:
 
         [Raises]
         ValueError
-            if the either latitude and/or longitude is not found, get
-            too many number, or outside Indonesian boundary
+            if the either latitude, longitude, and/or location string is
+            not found, or outside Indonesian boundary
         '''
+        loc = _LOC_RE.search(self.param_text[3])
+        if loc is None:
+            raise ValueError(f'latitude, longitude, or location string not found in {self.param_text[3]}, please refer to [{GetParam.recognized_str1}] or [{GetParam.recognized_str2}] format as example')
 
-        latlocator = ['LS','LU']
-        lonlocator = ['BT','BB']
-
-        # find location string located between () brackets
-        self.locstring = re.search(r"\(([^)]+)", self.param_text[3]).group(1)
-        self.location = self.locstring.split()[-1].replace('-',', ')
-
-        # find numbers in string with pattern \d+\.\d+
-        # where \d means digit characters and + is more than one
-        # \d+\.\d+ equal to float numbers
-        latlon = [float(i) for i in (re.findall("\d+\.\d+", self.param_text[3]))]
-        if len(latlon) < 2:
-            raise ValueError(f'either latitude or longitude not found in {latlon}')
-        elif len(latlon) > 2:
-            raise ValueError(f'too many number found, cant determine latitude and longitude from {latlon}')
-
-        if -11.0 <= latlon[0] <= 6:
-            self.latitude, self.longitude = latlon[0], latlon[1]
-        elif -11.0 <= latlon[1] <= 6:
-            self.latitude, self.longitude = latlon[1], latlon[0]
+        groups = loc.groups()
+        if groups[0] is not None:
+            lat, latcode, lon, loncode = groups[:4]
         else:
-            raise ValueError(f'latitude value of {latlon} are outside of Indonesian latitude')
+            lon, loncode, lat, latcode = groups[4:8]
+        locstring = groups[8]
+        if not locstring.strip():
+            raise ValueError(f'location string not found in {self.param_text[3]}, the location shall be inside () brackets')
+
+        # boundary check on signed latitude, 11° LS to 6° LU
+        lat = float(lat)
+        if not -11.0 <= _LAT_SIGN[latcode] * lat <= 6:
+            raise ValueError(f'latitude value of {lat}° {latcode} are outside of Indonesian latitude')
+
+        self._set_loc(lat, latcode, float(lon), loncode, locstring)
+
+    def _set_loc(self, lat, latcode, lon, loncode, locstring):
+        '''
+        [Arguments]
+        lat, lon : float
+            unsigned latitude and longitude
+        latcode, loncode : str
+            latlocator code (LS/LU) and lonlocator code (BT/BB)
+        locstring : str
+            string of earthquake location information
+        '''
+        self.locstring = locstring
+        self.location = locstring.split()[-1].replace('-',', ')
+
+        self.latlocator = f'{lat}° {latcode}'
+        self.lonlocator = f'{lon}° {loncode}'
+        self.latitude = _LAT_SIGN[latcode] * lat
+        self.longitude = _LON_SIGN[loncode] * lon
+
+    @classmethod
+    def parse_batch(cls, series):
+        '''
+        [Arguments]
+        series : pandas.Series
+            short messages of earthquake information, one message each
+            row
+
+        [Variables]
+        df : pandas.DataFrame
+            parameters extracted with single regex pass over the series,
+            columns are mag, date, time, zone, lat, latloc, lon, lonloc,
+            locstr, and depth. unrecognized messages resulted in NaN row.
+            matched case insensitive, so unlike get_param lower case
+            locator code (ls, bt, ...) also recognized. only latitude
+            written before longitude is recognized
+        latitude, longitude : pandas.Series
+            signed latitude and longitude, computed for whole column
+            at once
+        valid : pandas.Series
+            True if the signed latitude is inside Indonesian boundary
+            (11° LS to 6° LU)
+
+        [Returns]
+        df : pandas.DataFrame
+        '''
+        df = series.str.extract(_MSG_PATTERN, flags=re.IGNORECASE)
+
+        df[['mag', 'lat', 'lon']] = df[['mag', 'lat', 'lon']].astype(float)
+        df['depth'] = df['depth'].astype(float).astype('Int64')
+
+        # translate Indonesian month name before parsing whole column
+        dates = df['date'].str.lower().replace(_MONTH_MAP, regex=True)
+        df['date'] = pd.to_datetime(dates, format='%d-%b-%y', errors='coerce')
+
+        # sign flip and boundary check for whole column, without looping
+        # per messages
+        df['latitude'] = df['lat'] * df['latloc'].str.upper().map(_LAT_SIGN)
+        df['longitude'] = df['lon'] * df['lonloc'].str.upper().map(_LON_SIGN)
+        df['valid'] = df['latitude'].between(-11.0, 6.0)
+
+        return df
+
+    @classmethod
+    def parse_many(cls, texts):
+        '''
+        [Arguments]
+        texts : str, iterable
+            short messages of earthquake information
+
+        [Variables]
+        n : int
+            number of short messages, used to allocate array beforehand
+        params : dict
+            numpy array for each parameter in the same order as texts,
+            numbers in contiguous array (mag as float32, lat and lon as
+            float64, depth as int16) and strings in object array
+
+        [Returns]
+        params : dict
+
+        [Raises]
+        SyntaxError, TypeError, IndexError, ValueError
+            same as get_param for the first unrecognized short messages
+        ValueError
+            if the depth cant be stored as int16 (0 to 32767 km)
+        '''
+        texts = list(texts)
+        n = len(texts)
+
+        # magnitude only have 1 decimal and depth is below 1000 km, so
+        # float32 and int16 is enough for them
+        mags = np.empty(n, dtype=np.float32)
+        lats = np.empty(n, dtype=np.float64)
+        lons = np.empty(n, dtype=np.float64)
+        depths = np.empty(n, dtype=np.int16)
+        strs = {attr: np.empty(n, dtype=object) for attr in
+                ('dayname', 'origintime', 'timestring', 'locstring',
+                 'location', 'latlocator', 'lonlocator')}
+
+        for i, text in enumerate(texts):
+            getparam = cls(text)
+            getparam.get_param()
+            if not 0 <= getparam.depth <= np.iinfo(np.int16).max:
+                raise ValueError(f'depth value of {getparam.depth} km in {text} are outside of int16 range')
+
+            mags[i] = getparam.mag
+            lats[i] = getparam.latitude
+            lons[i] = getparam.longitude
+            depths[i] = getparam.depth
+            for attr, arr in strs.items():
+                arr[i] = getattr(getparam, attr)
 
-        for el in latlocator:
-            if el in self.param_text[3]:
-                self.latlocator = f'{self.latitude}° {el}'
-                if el == 'LS':
-                    self.latitude = -self.latitude
+        params = {'mag': mags, 'lat': lats, 'lon': lons, 'depth': depths}
+        params.update(strs)
 
-        for el in lonlocator:
-            if el in self.param_text[3]:
-                self.lonlocator = f'{self.longitude}° {el}'
-                if el == 'BB':
-                    self.longitude = -self.longitude
+        return params
 
 
 
@@ -284,8 +496,8 @@ if __name__ == '__main__':
 
         print(getparam.param_text)
 
-        title_str = f'*GEMPABUMI TEKTONIK M{getparam.mag[0]} DI {getparam.location.upper()}, TIDAK BERPOTENSI TSUNAMI*'
+        title_str = f'*GEMPABUMI TEKTONIK M{getparam.mag} DI {getparam.location.upper()}, TIDAK BERPOTENSI TSUNAMI*'
         str_1st = f'''*Kejadian dan Parameter Gempabumi:*
-Hari {getparam.dayname}, {getparam.origintime} pukul {getparam.timestring} wilayah {getparam.location.title()} diguncang gempa tektonik. Hasil analisis BMKG menunjukkan gempabumi ini memiliki parameter dengan magnitudo M{getparam.mag[0]}. Episenter gempabumi terletak pada koordinat {getparam.latlocator} ; {getparam.lonlocator}, atau tepatnya berlokasi di [land_or_sea] pada jarak {getparam.locstring} pada kedalaman {getparam.depth[0]} km.
+Hari {getparam.dayname}, {getparam.origintime} pukul {getparam.timestring} wilayah {getparam.location.title()} diguncang gempa tektonik. Hasil analisis BMKG menunjukkan gempabumi ini memiliki parameter dengan magnitudo M{getparam.mag}. Episenter gempabumi terletak pada koordinat {getparam.latlocator} ; {getparam.lonlocator}, atau tepatnya berlokasi di [land_or_sea] pada jarak {getparam.locstring} pada kedalaman {getparam.depth} km.
         '''
         print(f'{title_str}\n{str_1st}')
\ No newline at end of file
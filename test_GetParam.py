@@ -0,0 +1,79 @@
+import pandas as pd
+import pytest
+
+from GetParam import GetParam
+
+PPI = GetParam.recognized_str1
+KSI = 'Info Gempa Mag:3.0, 21-Jan-24 18:29:27 WIB,Lok: 2.52 LS - 102.26 BT (49 km Tenggara MERANGIN-JAMBI), Kedlmn:, 5 Km ::BMKG-KSI'
+GSI = 'Info Gempa Mag:3.1, 20-Jan-24 20:43:28 WIB,Lok: 0.27 LS - 99.56 BT (51 km BaratDaya PASAMANBARAT-SUMBAR), Kedlmn: 3 Km ::BMKG-GSI'
+
+ATTRS = ('mag', 'dayname', 'origintime', 'timestring', 'depth', 'locstring',
+         'location', 'latitude', 'longitude', 'latlocator', 'lonlocator')
+
+RECOGNIZED = [PPI, GetParam.recognized_str2, KSI, GSI]
+VARIANTS = [
+    PPI.replace('LS', 'ls').replace('BT', 'bt'),
+    PPI.replace('Mag', 'mag'),
+    KSI.replace('Kedlmn', 'kedlmn'),
+    GSI.replace('WIB', 'wib'),
+    # 3 comma with comma between LS and BT but not before Kedlmn
+    PPI.replace('), Kedlmn', ') Kedlmn'),
+    # south of 6° LS is still inside Indonesian boundary
+    PPI.replace('0.30 LS', '8.50 LS'),
+]
+
+
+def per_param(text):
+    getparam = GetParam(text)
+    getparam.get_mag()
+    getparam.get_ot()
+    getparam.get_depth()
+    getparam.get_loc()
+    return getparam
+
+
+@pytest.mark.parametrize('text', RECOGNIZED)
+def test_parse_all_accept_recognized(text):
+    assert GetParam(text)._parse_all()
+
+
+@pytest.mark.parametrize('text', RECOGNIZED + VARIANTS)
+def test_parse_all_same_as_per_param(text):
+    fused = GetParam(text)
+    if not fused._parse_all():
+        return
+
+    # anything accepted by single match shall also be parsed per
+    # parameter with the same result
+    perparam = per_param(text)
+    for attr in ATTRS:
+        assert getattr(fused, attr) == getattr(perparam, attr), attr
+
+
+def test_latitude_boundary_is_signed():
+    getparam = GetParam(PPI.replace('0.30 LS', '8.50 LS'))
+    getparam.get_param()
+    assert getparam.latitude == -8.5
+
+    with pytest.raises(ValueError):
+        GetParam(PPI.replace('0.30 LS', '8.50 LU')).get_param()
+
+
+def test_parse_batch_case_insensitive():
+    df = GetParam.parse_batch(pd.Series([PPI.replace('Mag', 'mag'),
+                                         PPI.replace('LS', 'ls').replace('BT', 'bt')]))
+    assert df['mag'].tolist() == [2.9, 2.9]
+    assert df['latitude'].tolist() == [-0.3, -0.3]
+    assert df['valid'].all()
+
+
+def test_longitude_first():
+    getparam = GetParam(PPI.replace('0.30 LS,100.28 BT', '100.28 BT,0.30 LS'))
+    getparam.get_param()
+    assert (getparam.latitude, getparam.longitude) == (-0.3, 100.28)
+    assert (getparam.latlocator, getparam.lonlocator) == ('0.3° LS', '100.28° BT')
+
+
+def test_parse_many_depth_out_of_range():
+    with pytest.raises(ValueError):
+        GetParam.parse_many([PPI.replace('Kedlmn: 10 Km', 'Kedlmn: 40000 Km')])